@@ -103,8 +103,9 @@ export function AIServiceControls() {
 
       setInitProgress('Loading Gemma model...');
       
-      // Try multiple model paths and formats (prioritize Gemma-3 1B-IT)
+      // Try multiple model paths and formats (prioritize the int4-quantized Gemma-3 1B-IT)
       const modelPaths = [
+        `${window.location.origin}/models/gemma3-1b-it-int4.task`,
         `${window.location.origin}/models/gemma3-1b-it.task`,
         `${window.location.origin}/models/gemma3-1b-it-web.task`,
         `${window.location.origin}/models/gemma-3-1b-it.task`,
@@ -116,36 +117,43 @@ export function AIServiceControls() {
       let modelPath = null;
       let llmInference = null;
 
-      // Try each model path
-      for (const path of modelPaths) {
+      // Check which model files are accessible (all probes in parallel)
+      const probes = await Promise.all(modelPaths.map(async (path) => {
+        try {
+          const response = await fetch(path, { method: 'HEAD' });
+          console.log(`Model file ${path.split('/').pop()} accessibility:`, response.status, response.statusText);
+          return response.ok ? { path, fileSize: response.headers.get('content-length') } : null;
+        } catch (error) {
+          console.log(`Failed to probe model ${path.split('/').pop()}:`, error);
+          return null;
+        }
+      }));
+      const availableModels = probes.filter(
+        (probe): probe is { path: string; fileSize: string | null } => probe !== null
+      );
+
+      // Try each available model in priority order
+      for (const { path, fileSize } of availableModels) {
         try {
           const modelName = path.split('/').pop();
           setInitProgress(`Trying model: ${modelName}...`);
           console.log('Attempting to load model from:', path);
-          
-          // Check if model file is accessible
-          const response = await fetch(path, { method: 'HEAD' });
-          console.log(`Model file ${modelName} accessibility:`, response.status, response.statusText);
-          
-          if (response.ok) {
-            const fileSize = response.headers.get('content-length');
-            console.log(`Model file ${modelName} size:`, fileSize);
-            
-            // Try to create LLM Inference instance
-            llmInference = await LlmInference.createFromOptions(genai, {
-              baseOptions: {
-                modelAssetPath: path
-              },
-              maxTokens: 1000,
-              topK: 40,
-              temperature: 0.7,
-              randomSeed: 101
-            });
-            
-            modelPath = path;
-            console.log('Successfully loaded model:', path);
-            break;
-          }
+          console.log(`Model file ${modelName} size:`, fileSize);
+
+          // Try to create LLM Inference instance
+          llmInference = await LlmInference.createFromOptions(genai, {
+            baseOptions: {
+              modelAssetPath: path
+            },
+            maxTokens: 1000,
+            topK: 40,
+            temperature: 0.7,
+            randomSeed: 101
+          });
+
+          modelPath = path;
+          console.log('Successfully loaded model:', path);
+          break;
         } catch (error) {
           console.log(`Failed to load model ${path.split('/').pop()}:`, error);
           continue;
@@ -153,7 +161,7 @@ export function AIServiceControls() {
       }
 
       if (!llmInference) {
-        throw new Error('No compatible MediaPipe model found. Please ensure you have a compatible Gemma model (.task format) in the /models directory. Supported models: gemma3-1b-it.task, gemma2b-it.task, gemma-2b-it.task, gemma-2b-it.bin');
+        throw new Error('No compatible MediaPipe model found. Please ensure you have a compatible Gemma model (.task format) in the /models directory. Supported models: gemma3-1b-it-int4.task, gemma3-1b-it.task, gemma2b-it.task, gemma-2b-it.task, gemma-2b-it.bin');
       }
       
       console.log('LLM Inference created successfully with model:', modelPath);
@@ -11,13 +11,37 @@ else
     echo "Ollama already installed"
 fi
 
+# Make sure the Ollama service is up before pulling, polling with backoff
+# instead of sleeping for a fixed time
+OLLAMA_URL="http://localhost:11434/api/tags"
+if ! curl -sf "$OLLAMA_URL" > /dev/null; then
+    echo "Starting Ollama service..."
+    ollama serve > /dev/null 2>&1 &
+fi
+
+delay=0.2
+deadline=$((SECONDS + 60))
+until curl -sf "$OLLAMA_URL" > /dev/null; do
+    if [ "$SECONDS" -ge "$deadline" ]; then
+        echo "Ollama service did not become ready within 60s"
+        exit 1
+    fi
+    sleep "$delay"
+    delay=$(awk -v d="$delay" 'BEGIN { d *= 1.5; print (d > 2 ? 2 : d) }')
+done
+echo "Ollama service is ready"
+
 # Pull Gemma 2 model
 echo "Downloading Gemma 2 model (this may take a while)..."
 ollama pull gemma2:9b
 
-# Test the model
-echo "Testing Gemma 2 model..."
-ollama run gemma2:9b "What is manufacturing process mining?" --verbose
+# Confirm the model is registered (avoids loading the 9B weights just to test)
+if curl -sf "$OLLAMA_URL" | grep -q '"gemma2:9b"'; then
+    echo "Gemma 2 model is available"
+else
+    echo "Gemma 2 model was not found after pull"
+    exit 1
+fi
 
 echo "Local AI setup complete!"
 echo ""
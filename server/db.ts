@@ -3,5 +3,7 @@ import Database from 'better-sqlite3';
 import { drizzle } from 'drizzle-orm/better-sqlite3';
 
 const sqlite = new Database('./local-database.sqlite');
+// WAL lets dashboard reads proceed while a data import is writing
+sqlite.pragma('journal_mode = WAL');
 export const db = drizzle(sqlite, { schema });
-export const pool = sqlite;
\ No newline at end of file
+export const pool = sqlite;
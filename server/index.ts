@@ -1,6 +1,7 @@
 import express, { NextFunction, Response, type Request } from "express";
 import { registerRoutes } from "./routes";
 import { AIServiceFactory } from "./services/ai-service-factory";
+import { jsonPreview } from "./json-preview";
 import { log, serveStatic, setupVite } from "./vite";
 
 const app = express();
@@ -23,7 +24,7 @@ app.use((req, res, next) => {
     if (path.startsWith("/api")) {
       let logLine = `${req.method} ${path} ${res.statusCode} in ${duration}ms`;
       if (capturedJsonResponse) {
-        logLine += ` :: ${JSON.stringify(capturedJsonResponse)}`;
+        logLine += ` :: ${jsonPreview(capturedJsonResponse, 80)}`;
       }
 
       if (logLine.length > 80) {
@@ -69,7 +70,12 @@ app.use((req, res, next) => {
   // Use a more reliable port configuration for local development
   const port = Number(process.env.PORT) || 5000;
   const host = process.env.NODE_ENV === "development" ? "127.0.0.1" : "0.0.0.0";
-  
+
+  // Keep idle connections open longer than typical proxy/load balancer idle
+  // timeouts so dashboard polling reuses sockets instead of reconnecting
+  server.keepAliveTimeout = 65000;
+  server.headersTimeout = 66000;
+
   server.listen(port, host, () => {
     log(`serving on http://${host}:${port}`);
   });
@@ -0,0 +1,65 @@
+const PREVIEW_FULL = Symbol("preview-full");
+
+/**
+ * Serialize like JSON.stringify, but stop once `limit` characters have been
+ * produced. The request log is truncated to a single short line, so there is
+ * no point encoding multi-megabyte event payloads in full just to log them.
+ *
+ * Follows JSON.stringify's rules for toJSON(key), boxed primitives, non-finite
+ * numbers (null), and undefined/function/symbol values (omitted from objects,
+ * null in arrays). Strings longer than `limit` are truncated before encoding,
+ * and the output may overshoot `limit` by up to one written chunk.
+ */
+export function jsonPreview(value: unknown, limit: number): string {
+  let out = "";
+  const write = (chunk: string) => {
+    out += chunk;
+    if (out.length >= limit) throw PREVIEW_FULL;
+  };
+  const resolve = (val: any, key: string): any => {
+    if (val !== null && typeof val === "object") {
+      if (typeof val.toJSON === "function") return val.toJSON(key);
+      if (val instanceof Number || val instanceof String || val instanceof Boolean) return val.valueOf();
+    }
+    return val;
+  };
+  const skipped = (val: any) =>
+    val === undefined || typeof val === "function" || typeof val === "symbol";
+
+  const visit = (val: any): void => {
+    if (typeof val === "string") {
+      write(JSON.stringify(val.length > limit ? val.slice(0, limit) : val));
+    } else if (typeof val === "number") {
+      write(Number.isFinite(val) ? String(val) : "null");
+    } else if (typeof val === "boolean" || val === null) {
+      write(String(val));
+    } else if (Array.isArray(val)) {
+      write("[");
+      for (let i = 0; i < val.length; i++) {
+        if (i > 0) write(",");
+        const item = resolve(val[i], String(i));
+        skipped(item) ? write("null") : visit(item);
+      }
+      write("]");
+    } else {
+      write("{");
+      let first = true;
+      for (const key of Object.keys(val)) {
+        const item = resolve(val[key], key);
+        if (skipped(item)) continue;
+        write(`${first ? "" : ","}${JSON.stringify(key)}:`);
+        first = false;
+        visit(item);
+      }
+      write("}");
+    }
+  };
+
+  try {
+    const root = resolve(value, "");
+    if (!skipped(root)) visit(root);
+  } catch (error) {
+    if (error !== PREVIEW_FULL) throw error;
+  }
+  return out;
+}
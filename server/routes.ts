@@ -8,11 +8,16 @@ import { db } from "./db";
 import { AIAnalyst } from "./services/ai-analyst";
 import { AIServiceFactory } from "./services/ai-service-factory";
 import { AnomalyDetector } from "./services/anomaly-detector";
+import { FailureAnalyzer } from "./services/failure-analyzer";
+import { IntelligentAnalyst } from "./services/intelligent-analyst";
 import { RAGService } from "./services/rag-service";
 import { SemanticSearch } from "./services/semantic-search";
 import { XESParser } from "./services/xes-parser";
 import { storage } from "./storage";
 
+// Keywords that mark a query as failure-related ('fail' also covers 'failure')
+const FAILURE_QUERY_PATTERN = /fail|cause|problem|issue|error/i;
+
 // Validation schemas
 const dashboardFiltersSchema = z.object({
   datasetSize: z.enum(['full', 'last_1000', 'last_500', 'custom']).optional(),
@@ -48,6 +53,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // Initialize data import on startup
   let dataImported = false;
 
+  // Health probes poll frequently; reuse recent dashboard metrics for a short
+  // window instead of re-running every aggregate query on each probe
+  const HEALTH_METRICS_TTL_MS = 2000;
+  let healthMetricsCache: {
+    metrics: Awaited<ReturnType<typeof storage.getDashboardMetrics>>;
+    expiresAt: number;
+  } | null = null;
+
   // Data Import and Management Routes
   app.post("/api/import-sample-data", async (req, res) => {
     try {
@@ -99,6 +112,10 @@ export async function registerRoutes(app: Express): Promise<Server> {
         message: 'Failed to import your sample data',
         error: error instanceof Error ? error.message : String(error)
       });
+    } finally {
+      // Invalidate even when the import fails part-way, since the old rows are gone
+      healthMetricsCache = null;
+      AIServiceFactory.clearLocalResponseCache();
     }
   });
 
@@ -169,6 +186,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       
       // Build filter criteria for data scoping
       let scopedActivities = await storage.getProcessActivities();
+      const originalCount = scopedActivities.length;
       
       // Primary Data Scope Layer
       if (filters.scopeType === 'dataset' && filters.datasetSize !== 'full') {
@@ -235,8 +253,9 @@ export async function registerRoutes(app: Express): Promise<Server> {
       }
       
       if (filters.caseIds && filters.caseIds.length > 0) {
+        const selectedCaseIds = new Set(filters.caseIds);
         scopedActivities = scopedActivities.filter(activity => 
-          filters.caseIds.includes(activity.caseId)
+          selectedCaseIds.has(activity.caseId)
         );
       }
       
@@ -249,22 +268,21 @@ export async function registerRoutes(app: Express): Promise<Server> {
         });
       }
 
-      // Get unique case IDs from scoped activities
-      const scopedCaseIds = Array.from(new Set(scopedActivities.map(a => a.caseId)));
+      // Get unique case IDs from scoped activities (a Set for O(1) membership below)
+      const scopedCaseIds = new Set(scopedActivities.map(a => a.caseId));
       
       // Get events and cases for the scoped data
       const allEvents = await storage.getProcessEvents();
       const allCases = await storage.getProcessCases();
       
       const scopedEvents = allEvents.filter(event => 
-        scopedCaseIds.includes(event.caseId)
+        scopedCaseIds.has(event.caseId)
       );
       const scopedCases = allCases.filter(processCase => 
-        scopedCaseIds.includes(processCase.caseId)
+        scopedCaseIds.has(processCase.caseId)
       );
 
       // Run anomaly detection on scoped data only
-      const AnomalyDetector = (await import('./services/anomaly-detector.js')).AnomalyDetector;
       const scopedAnomalies = [];
       
       // Detect anomalies in the scoped activities and mark them
@@ -362,7 +380,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         metrics: scopedMetrics,
         totalCount: scopedActivities.length,
         scopeInfo: {
-          originalCount: (await storage.getProcessActivities()).length,
+          originalCount,
           scopedCount: scopedActivities.length,
           filterType: filters.scopeType,
           appliedFilters: filters
@@ -439,7 +457,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
         sessionId: parsedRequest.sessionId || 'default'
       };
       // Use AI service factory to choose between OpenAI and Local AI
-      const { AIServiceFactory } = await import('./services/ai-service-factory');
       const response = await AIServiceFactory.analyzeQuery(request);
       res.json(response);
     } catch (error) {
@@ -463,7 +480,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
         });
       }
 
-      const { IntelligentAnalyst } = await import('./services/intelligent-analyst.js');
       const result = await IntelligentAnalyst.intelligentAnalysis(query, filters);
       
       // Store conversation in database
@@ -505,13 +521,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
     try {
       const { query, sessionId, filters } = req.body;
       
-      const { FailureAnalyzer } = await import('./services/failure-analyzer.js');
-      
       // Detect if this is a failure-related query
-      const queryLower = query.toLowerCase();
-      const isFailureQuery = queryLower.includes('failure') || queryLower.includes('fail') || 
-                            queryLower.includes('cause') || queryLower.includes('problem') ||
-                            queryLower.includes('issue') || queryLower.includes('error');
+      const isFailureQuery = FAILURE_QUERY_PATTERN.test(query);
       
       if (!isFailureQuery) {
         return res.status(400).json({ 
@@ -823,11 +834,17 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // Health Check Route
   app.get("/api/health", async (req, res) => {
     try {
-      const metrics = await storage.getDashboardMetrics();
+      const now = Date.now();
+      if (!healthMetricsCache || healthMetricsCache.expiresAt <= now) {
+        healthMetricsCache = {
+          metrics: await storage.getDashboardMetrics(),
+          expiresAt: now + HEALTH_METRICS_TTL_MS
+        };
+      }
       res.json({
         status: 'healthy',
         dataImported,
-        metrics,
+        metrics: healthMetricsCache.metrics,
         timestamp: new Date().toISOString()
       });
     } catch (error) {
@@ -868,11 +885,14 @@ export async function registerRoutes(app: Express): Promise<Server> {
     } catch (error) {
       console.error('Data refresh failed:', error);
       res.status(500).json({ error: error instanceof Error ? error.message : String(error) });
+    } finally {
+      healthMetricsCache = null;
+      AIServiceFactory.clearLocalResponseCache();
     }
   });
 
   // Auto-import sample data on startup if not already imported
-  setTimeout(async () => {
+  const autoImportSampleData = async () => {
     if (!dataImported) {
       try {
         console.log('Clearing existing data and importing your sample_data.csv...');
@@ -898,9 +918,12 @@ export async function registerRoutes(app: Express): Promise<Server> {
         console.log('✓ Your manufacturing data import completed successfully');
       } catch (error) {
         console.error('Auto-import failed:', error);
+      } finally {
+        healthMetricsCache = null;
+        AIServiceFactory.clearLocalResponseCache();
       }
     }
-  }, 2000);
+  };
 
   // AI Service Control endpoints
   app.post('/api/ai/switch-to-local', async (req, res) => {
@@ -943,8 +966,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.get('/api/ai/status', (req, res) => {
     try {
-      const status = AIServiceFactory.getStatus();
-      res.json(status);
+      res.type('application/json').send(AIServiceFactory.getStatusJSON());
     } catch (error) {
       console.error('Error getting AI status:', error);
       res.status(500).json({ 
@@ -1000,6 +1022,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
   app.post('/api/rag/clear', async (req, res) => {
     try {
       await RAGService.clearKnowledgeBase();
+      AIServiceFactory.clearLocalResponseCache();
       res.json({
         success: true,
         message: 'RAG knowledge base cleared'
@@ -1015,5 +1038,10 @@ export async function registerRoutes(app: Express): Promise<Server> {
   });
 
   const httpServer = createServer(app);
+
+  // Start the import as soon as the server is accepting connections rather
+  // than after a fixed delay
+  httpServer.once('listening', autoImportSampleData);
+
   return httpServer;
 }
@@ -1,12 +1,146 @@
 import { storage } from '../storage';
 import { AIAnalysisRequest, AIAnalysisResponse, AIAnalyst } from './ai-analyst';
-import { RAGService } from './rag-service';
+import { LRUCache } from './lru-cache';
+import { QAPair, RAGService } from './rag-service';
+
+/**
+ * Keyword rules for query classification, checked in priority order
+ */
+const QUERY_TYPE_RULES: ReadonlyArray<{ queryType: string; keywords: readonly string[] }> = [
+  { queryType: 'temporal_pattern_analysis', keywords: ['hour', 'time', 'temporal'] },
+  { queryType: 'failure_analysis', keywords: ['failure', 'fail', 'error'] },
+  { queryType: 'anomaly_analysis', keywords: ['anomaly', 'outlier', 'unusual'] },
+  { queryType: 'bottleneck_analysis', keywords: ['bottleneck', 'delay', 'slow'] },
+  { queryType: 'case_analysis', keywords: ['case', 'workflow'] }
+];
+
+/**
+ * All rule keywords compiled into one pattern with a capture group per rule.
+ * The lookahead keeps matches zero-width so overlapping keywords are all seen.
+ */
+const QUERY_TYPE_PATTERN = new RegExp(
+  `(?=${QUERY_TYPE_RULES.map(rule => `(${rule.keywords.join('|')})`).join('|')})`,
+  'gi'
+);
+
+/**
+ * Queries that need failure statistics gathered ('fail' also covers 'failure')
+ */
+const FAILURE_DATA_PATTERN = /fail|cause|problem|hour/i;
+
+/**
+ * Queries mentioning both hours and failures, in either order
+ */
+const HOURLY_FAILURE_PATTERN = /hour[\s\S]*failure|failure[\s\S]*hour/i;
+
+/**
+ * Canned offline responses - static text, so built once at module load
+ */
+const OFFLINE_RESPONSES = {
+  temporal: `**Temporal Analysis**\n\nFor failure analysis by hour, I typically examine:\n- Hourly failure distribution patterns\n- Peak failure periods\n- Working hours vs after-hours failures\n\n🔍 **Expected Insights**: Manufacturing failures often cluster during specific operational hours.`,
+  failure: `**Failure Analysis**\n\nFor failure pattern analysis, I examine:\n- Failure frequency and timing\n- Common failure causes\n- Resource-specific failures\n\n🔍 **Expected Insights**: Process failures typically follow identifiable patterns.`,
+  bottleneck: `**Bottleneck Analysis**\n\nFor bottleneck identification, I analyze:\n- Processing time patterns\n- Resource utilization\n- Queue formations\n\n🔍 **Expected Insights**: Bottlenecks often occur at resource constraints.`,
+  general: `**General Process Analysis**\n\nI can help analyze:\n- Process performance patterns\n- Resource utilization\n- Temporal trends\n- Anomaly detection\n\n🔍 **Expected Insights**: Process data typically reveals optimization opportunities.`
+} as const;
+
+type OfflineCategory = keyof typeof OFFLINE_RESPONSES;
+
+/**
+ * Full offline-mode fallback bodies, wrapped once per category at module load
+ */
+const OFFLINE_FALLBACK_RESPONSES: Readonly<Record<OfflineCategory, string>> = Object.freeze(Object.fromEntries(
+  Object.entries(OFFLINE_RESPONSES).map(([category, insights]) => [
+    category,
+    `## 🤖 Local AI Analysis (Offline Mode)\n\n⚠️ **Limited Analysis Available**\n\nI encountered an issue accessing the full dataset, but I can provide basic insights:\n\n${insights}\n\n💡 **Note**: This is a simplified offline analysis. For full analysis, please check the data connection.`
+  ])
+) as Record<OfflineCategory, string>);
+
+/**
+ * Offline response categories, checked in priority order ('general' otherwise)
+ */
+const OFFLINE_CATEGORY_RULES: ReadonlyArray<{ category: OfflineCategory; pattern: RegExp }> = [
+  { category: 'temporal', pattern: HOURLY_FAILURE_PATTERN },
+  { category: 'failure', pattern: /fail/i },
+  { category: 'bottleneck', pattern: /bottleneck/i }
+];
+
+/**
+ * Follow-up suggestions appended to local analyses, by query type
+ */
+const LOCAL_SUGGESTIONS: Readonly<Record<string, readonly string[]>> = {
+  'temporal_pattern_analysis': [
+    'Schedule maintenance during low-failure hours',
+    'Investigate peak failure hour root causes',
+    'Implement time-based monitoring alerts'
+  ],
+  'failure_analysis': [
+    'Set up automated failure monitoring',
+    'Create failure prediction models',
+    'Implement preventive maintenance schedules'
+  ],
+  'activity_failure_analysis': [
+    'Focus improvement efforts on high-failure activities',
+    'Review activity-specific procedures',
+    'Implement activity-level quality controls'
+  ],
+  'general_analysis': [
+    'Export analysis results for deeper investigation',
+    'Set up regular monitoring dashboards',
+    'Create process improvement action plans'
+  ]
+};
+
+/**
+ * Chart hints returned with local analyses, by query type
+ */
+const VISUALIZATION_HINTS: Readonly<Record<string, string>> = {
+  'temporal_pattern_analysis': 'Time series chart showing failure distribution by hour',
+  'activity_failure_analysis': 'Bar chart showing failure rates by activity',
+  'failure_analysis': 'Pie chart showing failure categories and distribution',
+  'anomaly_analysis': 'Scatter plot showing anomaly distribution over time',
+  'bottleneck_analysis': 'Flow diagram highlighting process bottlenecks',
+  'case_analysis': 'Comparison chart between different workflow cases',
+  'general_analysis': 'Chart visualization based on analysis results'
+};
+
+/**
+ * First hourly entry with the highest failure count, found in a single pass
+ */
+function findPeakHour<T extends { count?: number }>(hourlyData: T[]): T | undefined {
+  let peak: T | undefined;
+  for (const entry of hourlyData) {
+    if (!peak || (entry.count || 0) > (peak.count || 0)) peak = entry;
+  }
+  return peak;
+}
+
+/**
+ * Build the AI service status payload for the given mode
+ */
+function buildStatus(useLocalAI: boolean) {
+  return {
+    useLocalAI,
+    currentService: useLocalAI ? 'Local AI Analysis Engine' : 'OpenAI GPT-4o',
+    localAIReady: true // Always ready since it's server-side processing
+  };
+}
+
+/**
+ * Serialized status payloads - there are only two states, so encode each once
+ */
+const STATUS_JSON = {
+  local: JSON.stringify(buildStatus(true)),
+  openai: JSON.stringify(buildStatus(false))
+} as const;
 
 /**
  * Factory to choose between OpenAI and Local AI based on configuration
  */
 export class AIServiceFactory {
   private static useLocalAI = process.env.USE_LOCAL_AI === 'true';
+  private static inFlightLocalAnalyses = new Map<string, Promise<AIAnalysisResponse>>();
+  private static localResponseCache = new LRUCache<string, AIAnalysisResponse>(256);
+  private static localResponseCacheGeneration = 0;
   
   /**
    * Initialize the factory and RAG system
@@ -24,6 +158,7 @@ export class AIServiceFactory {
   static async buildKnowledgeBase(forceRebuild: boolean = false): Promise<void> {
     console.log('🚀 Building RAG knowledge base with OpenAI responses...');
     await RAGService.buildKnowledgeBase(forceRebuild);
+    this.clearLocalResponseCache();
     
     const stats = RAGService.getKnowledgeBaseStats();
     console.log(`📊 Knowledge base built: ${stats.totalPairs} Q&A pairs across ${stats.categories.length} categories`);
@@ -36,7 +171,7 @@ export class AIServiceFactory {
     try {
       if (this.useLocalAI) {
         console.log('Using RAG-enhanced local AI analysis engine...');
-        return await this.performRAGEnhancedLocalAnalysis(request);
+        return await this.coalesceLocalAnalysis(request);
       } else {
         console.log('Using OpenAI for analysis...');
         return await AIAnalyst.analyzeQuery(request);
@@ -48,7 +183,7 @@ export class AIServiceFactory {
       if (this.useLocalAI) {
         console.log('Local AI error, providing offline fallback...');
         return {
-          response: `## 🤖 Local AI Analysis (Offline Mode)\n\n⚠️ **Limited Analysis Available**\n\nI encountered an issue accessing the full dataset, but I can provide basic insights:\n\n${this.generateBasicOfflineResponse(request.query)}\n\n💡 **Note**: This is a simplified offline analysis. For full analysis, please check the data connection.`,
+          response: this.generateBasicOfflineResponse(request.query),
           queryType: this.classifyQuery(request.query),
           contextData: { local: true, offline: true, error: true },
           suggestedActions: ['Check data connection', 'Verify database status', 'Try a simpler query'],
@@ -60,6 +195,47 @@ export class AIServiceFactory {
     }
   }
 
+  /**
+   * Serve repeated local analyses (same query and filters) from the response
+   * cache, and share one in-flight run between concurrent callers
+   */
+  private static coalesceLocalAnalysis(request: AIAnalysisRequest): Promise<AIAnalysisResponse> {
+    // Responses quote the caller's query text, so only identical queries may share a result
+    const key = JSON.stringify([request.query, request.filters ?? null]);
+    const cached = this.localResponseCache.get(key);
+    if (cached) return Promise.resolve(cached);
+
+    // Runs started before a cache clear may have read data that has since changed,
+    // so later callers must not join them
+    const generation = this.localResponseCacheGeneration;
+    const flightKey = `${generation}:${key}`;
+    let pending = this.inFlightLocalAnalyses.get(flightKey);
+    if (!pending) {
+      pending = this.performRAGEnhancedLocalAnalysis(request)
+        .then(response => {
+          // Only cache complete analyses, and never across a cache clear
+          const summary = response.contextData?.dataAnalyzed;
+          const complete = response.contextData?.ragEnhanced && !summary?.error && !summary?.partial && !response.data?.error;
+          if (complete && generation === this.localResponseCacheGeneration) {
+            this.localResponseCache.set(key, response);
+          }
+          return response;
+        })
+        .finally(() => this.inFlightLocalAnalyses.delete(flightKey));
+      this.inFlightLocalAnalyses.set(flightKey, pending);
+    }
+
+    return pending;
+  }
+
+  /**
+   * Drop cached local analyses (call whenever process data or RAG examples change)
+   */
+  static clearLocalResponseCache(): void {
+    this.localResponseCache.clear();
+    this.localResponseCacheGeneration++;
+  }
+
   /**
    * NEW: RAG-enhanced local AI analysis
    */
@@ -71,15 +247,17 @@ export class AIServiceFactory {
       // Step 1: Gather relevant data (same as before)
       const relevantData = await this.gatherRelevantDataLocal(request.query, queryType, request.filters);
       
-      // Step 2: Enhance prompt with RAG examples
-      const enhancedPrompt = await RAGService.enhancePromptWithRAG(request.query);
+      // Step 2: Enhance prompt with RAG examples (looked up once, reused below)
+      const similarExamples = await RAGService.findSimilarExamples(request.query);
+      const enhancedPrompt = RAGService.buildEnhancedPrompt(request.query, similarExamples);
       
       // Step 3: Create a comprehensive analysis using enhanced prompt
       const ragEnhancedResponse = await this.formatRAGEnhancedResponse(
         request.query, 
         queryType, 
         relevantData, 
-        enhancedPrompt
+        enhancedPrompt,
+        similarExamples
       );
       
       // Step 4: Generate intelligent suggestions
@@ -93,7 +271,7 @@ export class AIServiceFactory {
         contextData: { 
           local: true, 
           ragEnhanced: true,
-          examplesFound: await RAGService.findSimilarExamples(request.query).then(examples => examples.length),
+          examplesFound: similarExamples.length,
           dataAnalyzed: relevantData.summary,
           queryClassification: queryType 
         },
@@ -117,12 +295,11 @@ export class AIServiceFactory {
     query: string, 
     queryType: string, 
     relevantData: any, 
-    enhancedPrompt: string
+    enhancedPrompt: string,
+    similarExamples: QAPair[]
   ): Promise<string> {
     try {
-      // Get stored OpenAI examples that are similar to this query
-      const similarExamples = await RAGService.findSimilarExamples(query, { maxExamples: 2 });
-      
+      // Stored OpenAI examples similar to this query, best match first
       if (similarExamples.length === 0) {
         // No examples found, use basic response
         return this.formatEnhancedLocalResponse(query, queryType, relevantData, {});
@@ -163,10 +340,11 @@ export class AIServiceFactory {
    */
   private static enhanceFailureAnalysisWithRAG(relevantData: any, openaiExample: string): string {
     // Extract analytical sophistication from OpenAI example
+    const exampleLower = openaiExample.toLowerCase();
     const hasDetailedStats = openaiExample.includes('%') && openaiExample.includes('failures');
-    const hasRootCause = openaiExample.toLowerCase().includes('root cause') || openaiExample.toLowerCase().includes('primary cause');
-    const hasRecommendations = openaiExample.toLowerCase().includes('recommend') || openaiExample.toLowerCase().includes('suggest');
-    const hasBusinessImpact = openaiExample.toLowerCase().includes('impact') || openaiExample.toLowerCase().includes('risk');
+    const hasRootCause = exampleLower.includes('root cause') || exampleLower.includes('primary cause');
+    const hasRecommendations = exampleLower.includes('recommend') || exampleLower.includes('suggest');
+    const hasBusinessImpact = exampleLower.includes('impact') || exampleLower.includes('risk');
     const isExecutiveLevel = openaiExample.includes('Executive') || openaiExample.includes('Summary');
     
     let analysis = `### 🔍 Manufacturing Failure Analysis\n\n`;
@@ -223,9 +401,10 @@ export class AIServiceFactory {
    */
   private static enhanceTemporalAnalysisWithRAG(relevantData: any, openaiExample: string): string {
     // Extract OpenAI's analytical depth
+    const exampleLower = openaiExample.toLowerCase();
     const hasDetailedTemporal = openaiExample.includes('hour') && openaiExample.includes('pattern');
-    const hasOperationalInsights = openaiExample.toLowerCase().includes('shift') || openaiExample.toLowerCase().includes('operational');
-    const hasBusinessContext = openaiExample.toLowerCase().includes('business') || openaiExample.toLowerCase().includes('impact');
+    const hasOperationalInsights = exampleLower.includes('shift') || exampleLower.includes('operational');
+    const hasBusinessContext = exampleLower.includes('business') || exampleLower.includes('impact');
     const hasQuantitativeAnalysis = openaiExample.includes('%') && openaiExample.includes('analysis');
     
     let analysis = `### ⏰ Temporal Failure Pattern Analysis\n\n`;
@@ -289,7 +468,8 @@ export class AIServiceFactory {
     let analysis = `### 📊 Process Analysis\n\n`;
     
     const hasDetailedAnalysis = openaiExample.length > 500;
-    const hasSystematicApproach = openaiExample.toLowerCase().includes('analysis') && openaiExample.toLowerCase().includes('data');
+    const exampleLower = openaiExample.toLowerCase();
+    const hasSystematicApproach = exampleLower.includes('analysis') && exampleLower.includes('data');
     
     if (hasDetailedAnalysis) {
       analysis += `**Comprehensive Process Examination:**\n`;
@@ -324,7 +504,6 @@ export class AIServiceFactory {
     
     try {
       console.log(`Classifying query: ${request.query}`);
-      console.log(`Found ${await this.getDataSummary()} actual failure events out of ${await this.getTotalEvents()} total events`);
       
       // Use completely local data gathering without external dependencies
       const relevantData = await this.gatherRelevantDataLocal(request.query, queryType, request.filters);
@@ -394,12 +573,7 @@ export class AIServiceFactory {
       data.summary.totalEvents = scopedEvents.length;
 
       // Enhanced failure analysis - FIXED VERSION
-      if (queryType === 'temporal_pattern_analysis' || 
-          query.toLowerCase().includes('failure') || 
-          query.toLowerCase().includes('fail') || 
-          query.toLowerCase().includes('cause') || 
-          query.toLowerCase().includes('problem') ||
-          query.toLowerCase().includes('hour')) {
+      if (queryType === 'temporal_pattern_analysis' || FAILURE_DATA_PATTERN.test(query)) {
         
         try {
           // Use the same failure detection logic as OpenAI
@@ -498,15 +672,17 @@ export class AIServiceFactory {
           data.summary.actualFailureCount = 0;
           data.summary.failureRate = 0;
           data.summary.topFailureTypes = ['Analysis unavailable'];
+          data.summary.partial = true;
         }
       }
 
       // Temporal analysis for hour-based queries  
-      if (queryType === 'temporal_pattern_analysis' || (query.toLowerCase().includes('hour') && query.toLowerCase().includes('failure'))) {
+      if (queryType === 'temporal_pattern_analysis' || HOURLY_FAILURE_PATTERN.test(query)) {
         const temporalData = await this.performTemporalAnalysis();
         data.temporalAnalysis = temporalData;
         data.summary.temporalPeakHour = temporalData.peakFailureHour;
         data.summary.temporalAnalysisType = 'hourly_failures';
+        if (temporalData.error) data.summary.partial = true;
       }
 
       return data;
@@ -620,8 +796,8 @@ export class AIServiceFactory {
   private static formatDetailedTemporalAnalysis(query: string, structuredData: any): string {
     const hourlyData = structuredData.hourlyFailures;
     const totalFailures = structuredData.totalFailures;
-    const maxFailures = Math.max(...hourlyData.map((h: any) => h.count));
-    const peakHour = hourlyData.find((h: any) => h.count === maxFailures);
+    const peakHour = findPeakHour(hourlyData);
+    const maxFailures = peakHour?.count || 0;
     
     let response = "## Executive Summary\n";
     response += "The analysis reveals significant temporal patterns in your manufacturing process failures. ";
@@ -814,8 +990,7 @@ export class AIServiceFactory {
     
     if (queryType === 'temporal_pattern_analysis' && structuredData.hourlyFailures) {
       const hourlyData = structuredData.hourlyFailures;
-      const maxFailures = Math.max(...hourlyData.map(h => h.count));
-      const peakHour = hourlyData.find(h => h.count === maxFailures);
+      const peakHour = findPeakHour(hourlyData);
       
       if (peakHour) {
         suggestions.push(`Focus maintenance efforts before ${peakHour.hour}:00 when failures peak`);
@@ -834,34 +1009,6 @@ export class AIServiceFactory {
     return suggestions;
   }
 
-  /**
-   * Get a summary of failure data for logging
-   */
-  private static async getDataSummary(): Promise<number> {
-    try {
-      const events = await storage.getProcessEvents({ limit: 1000 });
-      return events.filter(e => 
-        e.lifecycleState === 'failure' || 
-        e.lifecycleTransition === 'failure' ||
-        (e.unsatisfiedConditionDescription && e.unsatisfiedConditionDescription.trim().length > 0)
-      ).length;
-    } catch {
-      return 0;
-    }
-  }
-
-  /**
-   * Get total events count for logging
-   */
-  private static async getTotalEvents(): Promise<number> {
-    try {
-      const events = await storage.getProcessEvents({ limit: 10000 });
-      return events.length;
-    } catch {
-      return 0;
-    }
-  }
-
   /**
    * Perform temporal analysis for failure patterns
    */
@@ -883,8 +1030,7 @@ export class AIServiceFactory {
         }
       });
       
-      const maxFailures = Math.max(...hourlyDistribution.map(h => h.count));
-      const peakHour = hourlyDistribution.find(h => h.count === maxFailures);
+      const peakHour = findPeakHour(hourlyDistribution);
       
       return {
         hourlyDistribution: hourlyDistribution.filter(h => h.count > 0),
@@ -896,7 +1042,8 @@ export class AIServiceFactory {
       return {
         hourlyDistribution: [],
         peakFailureHour: null,
-        totalFailures: 0
+        totalFailures: 0,
+        error: true
       };
     }
   }
@@ -1069,15 +1216,15 @@ export class AIServiceFactory {
   private static formatTemporalAnalysis(analysis: AIAnalysisResponse, query: string): string {
     let response = "**Temporal Pattern Analysis Results**\n\n";
     
-    if (query.toLowerCase().includes('hour') && query.toLowerCase().includes('failure')) {
+    if (HOURLY_FAILURE_PATTERN.test(query)) {
       response += "I've analyzed the hourly failure distribution patterns in your manufacturing data:\n\n";
       
       // Look for hourly data in the analysis
       if (analysis.data?.hourlyFailures || analysis.data?.temporalData) {
         const hourlyData = analysis.data.hourlyFailures || analysis.data.temporalData;
         if (Array.isArray(hourlyData)) {
-          const maxFailures = Math.max(...hourlyData.map((h: any) => h.count || 0));
-          const peakHour = hourlyData.find((h: any) => (h.count || 0) === maxFailures);
+          const peakHour = findPeakHour(hourlyData);
+          const maxFailures = peakHour?.count || 0;
           
           if (peakHour) {
             response += `🚨 **Peak Failure Hour**: ${peakHour.hour}:00 with ${maxFailures} failures\n\n`;
@@ -1142,31 +1289,7 @@ export class AIServiceFactory {
    */
   private static generateLocalSuggestions(queryType: string, analysis: AIAnalysisResponse): string[] {
     const baseSuggestions = analysis.suggestedActions || [];
-    
-    const localSuggestions: Record<string, string[]> = {
-      'temporal_pattern_analysis': [
-        'Schedule maintenance during low-failure hours',
-        'Investigate peak failure hour root causes',
-        'Implement time-based monitoring alerts'
-      ],
-      'failure_analysis': [
-        'Set up automated failure monitoring',
-        'Create failure prediction models',
-        'Implement preventive maintenance schedules'
-      ],
-      'activity_failure_analysis': [
-        'Focus improvement efforts on high-failure activities',
-        'Review activity-specific procedures',
-        'Implement activity-level quality controls'
-      ],
-      'general_analysis': [
-        'Export analysis results for deeper investigation',
-        'Set up regular monitoring dashboards',
-        'Create process improvement action plans'
-      ]
-    };
-    
-    const typeSpecific = localSuggestions[queryType] || localSuggestions['general_analysis'];
+    const typeSpecific = LOCAL_SUGGESTIONS[queryType] || LOCAL_SUGGESTIONS['general_analysis'];
     
     return Array.from(new Set([...baseSuggestions, ...typeSpecific]));
   }
@@ -1175,45 +1298,21 @@ export class AIServiceFactory {
    * Simple query classification
    */
   private static classifyQuery(query: string): string {
-    const lowerQuery = query.toLowerCase();
-    
-    if (lowerQuery.includes('hour') || lowerQuery.includes('time') || lowerQuery.includes('temporal')) {
-      return 'temporal_pattern_analysis';
-    }
-    if (lowerQuery.includes('failure') || lowerQuery.includes('fail') || lowerQuery.includes('error')) {
-      return 'failure_analysis';
-    }
-    if (lowerQuery.includes('activity') && lowerQuery.includes('fail')) {
-      return 'activity_failure_analysis';
-    }
-    if (lowerQuery.includes('anomaly') || lowerQuery.includes('outlier') || lowerQuery.includes('unusual')) {
-      return 'anomaly_analysis';
+    // Single scan over the query; the earliest rule that matched anywhere wins
+    let ruleIndex = QUERY_TYPE_RULES.length;
+    for (const match of query.matchAll(QUERY_TYPE_PATTERN)) {
+      const matchedRule = match.findIndex((group, index) => index > 0 && group !== undefined) - 1;
+      if (matchedRule < ruleIndex) ruleIndex = matchedRule;
+      if (ruleIndex === 0) break;
     }
-    if (lowerQuery.includes('bottleneck') || lowerQuery.includes('delay') || lowerQuery.includes('slow')) {
-      return 'bottleneck_analysis';
-    }
-    if (lowerQuery.includes('case') || lowerQuery.includes('workflow')) {
-      return 'case_analysis';
-    }
-    
-    return 'general_analysis';
+    return QUERY_TYPE_RULES[ruleIndex]?.queryType ?? 'general_analysis';
   }
 
   /**
    * Generate visualization hint based on query type
    */
   private static generateVisualizationHint(queryType: string): string {
-    const hints: Record<string, string> = {
-      'temporal_pattern_analysis': 'Time series chart showing failure distribution by hour',
-      'activity_failure_analysis': 'Bar chart showing failure rates by activity',
-      'failure_analysis': 'Pie chart showing failure categories and distribution',
-      'anomaly_analysis': 'Scatter plot showing anomaly distribution over time',
-      'bottleneck_analysis': 'Flow diagram highlighting process bottlenecks',
-      'case_analysis': 'Comparison chart between different workflow cases',
-      'general_analysis': 'Chart visualization based on analysis results'
-    };
-    
-    return hints[queryType] || 'Chart visualization based on analysis results';
+    return VISUALIZATION_HINTS[queryType] || 'Chart visualization based on analysis results';
   }
   
   /**
@@ -1236,37 +1335,33 @@ export class AIServiceFactory {
    * Get current AI service status
    */
   static getStatus() {
-    return {
-      useLocalAI: this.useLocalAI,
-      currentService: this.useLocalAI ? 'Local AI Analysis Engine' : 'OpenAI GPT-4o',
-      localAIReady: true // Always ready since it's server-side processing
-    };
+    return buildStatus(this.useLocalAI);
   }
 
   /**
-   * Cleanup
+   * Get current AI service status as a pre-serialized JSON body
+   */
+  static getStatusJSON(): string {
+    return this.useLocalAI ? STATUS_JSON.local : STATUS_JSON.openai;
+  }
+
+  /**
+   * Pick the offline response category for a query
    */
+  private static classifyOfflineQuery(query: string): OfflineCategory {
+    return OFFLINE_CATEGORY_RULES.find(rule => rule.pattern.test(query))?.category ?? 'general';
+  }
+
   /**
-   * Generate basic offline response when full analysis fails
+   * Generate the complete offline-mode response when full analysis fails
    */
   private static generateBasicOfflineResponse(query: string): string {
-    const queryLower = query.toLowerCase();
-    
-    if (queryLower.includes('hour') && queryLower.includes('failure')) {
-      return `**Temporal Analysis**\n\nFor failure analysis by hour, I typically examine:\n- Hourly failure distribution patterns\n- Peak failure periods\n- Working hours vs after-hours failures\n\n🔍 **Expected Insights**: Manufacturing failures often cluster during specific operational hours.`;
-    }
-    
-    if (queryLower.includes('failure') || queryLower.includes('fail')) {
-      return `**Failure Analysis**\n\nFor failure pattern analysis, I examine:\n- Failure frequency and timing\n- Common failure causes\n- Resource-specific failures\n\n🔍 **Expected Insights**: Process failures typically follow identifiable patterns.`;
-    }
-    
-    if (queryLower.includes('bottleneck')) {
-      return `**Bottleneck Analysis**\n\nFor bottleneck identification, I analyze:\n- Processing time patterns\n- Resource utilization\n- Queue formations\n\n🔍 **Expected Insights**: Bottlenecks often occur at resource constraints.`;
-    }
-    
-    return `**General Process Analysis**\n\nI can help analyze:\n- Process performance patterns\n- Resource utilization\n- Temporal trends\n- Anomaly detection\n\n🔍 **Expected Insights**: Process data typically reveals optimization opportunities.`;
+    return OFFLINE_FALLBACK_RESPONSES[this.classifyOfflineQuery(query)];
   }
 
+  /**
+   * Cleanup
+   */
   static async dispose() {
     console.log('AI Service Factory disposed');
   }
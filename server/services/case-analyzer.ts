@@ -1,6 +1,6 @@
 import { db } from "../db";
 import { processActivities, processEvents, processCases } from "@shared/schema";
-import { eq, sql, and, like, desc, asc, inArray } from "drizzle-orm";
+import { eq, sql, and, asc } from "drizzle-orm";
 
 export interface CaseAnalysisResult {
   caseId: string;
@@ -1,4 +1,4 @@
-import { FilesetResolver, LlmInference } from '@mediapipe/tasks-genai';
+import type { LlmInference } from '@mediapipe/tasks-genai';
 
 export interface LocalAIResponse {
   response: string;
@@ -34,6 +34,10 @@ export class LocalAIService {
 
     try {
       console.log('Initializing Local AI Service with MediaPipe...');
+
+      // Load MediaPipe only when a service is actually initialized, so importing
+      // this module does not pull in the GenAI runtime
+      const { FilesetResolver, LlmInference } = await import('@mediapipe/tasks-genai');
       
       // Initialize the FilesetResolver for GenAI tasks
       const genai = await FilesetResolver.forGenAiTasks(
@@ -114,16 +118,19 @@ export class LocalAIService {
       result.suggestedActions = [actionMatches[1].trim()];
     }
 
+    // Lowercase the (possibly long, RAG-enhanced) prompt once for all checks
+    const promptLower = originalPrompt.toLowerCase();
+
     // Parse temporal analysis patterns
-    if (originalPrompt.toLowerCase().includes('temporal') || 
-        originalPrompt.toLowerCase().includes('time') ||
-        originalPrompt.toLowerCase().includes('hour')) {
+    if (promptLower.includes('temporal') || 
+        promptLower.includes('time') ||
+        promptLower.includes('hour')) {
       result.visualizationData = this.extractTemporalData(response);
     }
 
     // Parse failure analysis patterns
-    if (originalPrompt.toLowerCase().includes('failure') || 
-        originalPrompt.toLowerCase().includes('error')) {
+    if (promptLower.includes('failure') || 
+        promptLower.includes('error')) {
       result.visualizationData = this.extractFailureData(response);
     }
 
@@ -0,0 +1,41 @@
+/**
+ * Small bounded least-recently-used cache backed by Map insertion order
+ */
+export class LRUCache<K, V> {
+  private readonly entries = new Map<K, V>();
+
+  constructor(private readonly maxSize: number) {}
+
+  /**
+   * Get a cached value and mark it as most recently used
+   */
+  get(key: K): V | undefined {
+    if (!this.entries.has(key)) return undefined;
+
+    const value = this.entries.get(key) as V;
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  /**
+   * Store a value, evicting the least recently used entry when full
+   */
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+
+    if (this.entries.size > this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.entries.delete(oldestKey);
+    }
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
@@ -18,6 +18,7 @@ export interface RAGConfig {
 
 export class RAGService {
   private static knowledgeBase: QAPair[] = [];
+  private static questionWords = new WeakMap<QAPair, string[]>();
   private static isInitialized = false;
   
   private static readonly DEFAULT_CONFIG: RAGConfig = {
@@ -117,10 +118,14 @@ export class RAGService {
     }
 
     // Simple keyword-based similarity for now (can be enhanced with embeddings)
-    const queryWords = query.toLowerCase().split(/\s+/);
+    const queryLower = query.toLowerCase();
+    const queryWords = queryLower.split(/\s+/);
+    const mentionsFailure = queryLower.includes('failure');
+    const mentionsTime = queryLower.includes('time');
+    const mentionsAnomaly = queryLower.includes('anomaly');
     
     const scoredPairs = this.knowledgeBase.map(qa => {
-      const questionWords = qa.question.toLowerCase().split(/\s+/);
+      const questionWords = this.getQuestionWords(qa);
       
       // Calculate similarity score
       let score = 0;
@@ -131,9 +136,9 @@ export class RAGService {
       });
       
       // Boost score for category keywords
-      if (query.toLowerCase().includes('failure') && qa.category.includes('Failure')) score += 2;
-      if (query.toLowerCase().includes('time') && qa.category.includes('Timing')) score += 2;
-      if (query.toLowerCase().includes('anomaly') && qa.category.includes('Anomaly')) score += 2;
+      if (mentionsFailure && qa.category.includes('Failure')) score += 2;
+      if (mentionsTime && qa.category.includes('Timing')) score += 2;
+      if (mentionsAnomaly && qa.category.includes('Anomaly')) score += 2;
       
       return { qa, score: score / queryWords.length };
     });
@@ -150,12 +155,30 @@ export class RAGService {
     return similarPairs;
   }
 
+  /**
+   * Lowercased question words for a Q&A pair, tokenized once and reused
+   */
+  private static getQuestionWords(qa: QAPair): string[] {
+    let words = this.questionWords.get(qa);
+    if (!words) {
+      words = qa.question.toLowerCase().split(/\s+/);
+      this.questionWords.set(qa, words);
+    }
+    return words;
+  }
+
   /**
    * Enhance local AI prompt with RAG examples
    */
   static async enhancePromptWithRAG(query: string, originalPrompt?: string): Promise<string> {
     const similarExamples = await this.findSimilarExamples(query);
-    
+    return this.buildEnhancedPrompt(query, similarExamples, originalPrompt);
+  }
+
+  /**
+   * Build the RAG-enhanced prompt from examples the caller already looked up
+   */
+  static buildEnhancedPrompt(query: string, similarExamples: QAPair[], originalPrompt?: string): string {
     if (similarExamples.length === 0) {
       return originalPrompt || `Analyze this manufacturing process query: ${query}`;
     }
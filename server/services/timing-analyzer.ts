@@ -1,6 +1,6 @@
 import { db } from "../db";
-import { processActivities, processEvents } from "@shared/schema";
-import { eq, sql, and, between, desc, asc } from "drizzle-orm";
+import { processActivities } from "@shared/schema";
+import { sql, desc } from "drizzle-orm";
 
 export interface TimingAnalysisResult {
   activityName: string;
@@ -1,6 +1,5 @@
 import { db } from "../db";
-import { processActivities, processEvents } from "@shared/schema";
-import { eq, sql, and, between, desc, asc } from "drizzle-orm";
+import { sql } from "drizzle-orm";
 
 export interface TrendAnalysisResult {
   period: string;